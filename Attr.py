@@ -3,17 +3,45 @@ Contains the implementation of the 'Attr' class.
 """
 
 import os
-import pickle
+
+import msgspec
 
 from MyTube import Option, Quality
 
 
+class AttrState(msgspec.Struct):
+    """
+    Serializable snapshot of the attributes in 'Attr'.
+    """
+
+    opt: str
+    vidQuality: str
+    audQuality: str
+    dir: str
+    confirmDownload: bool
+    closeAfterDownload: bool
+    # Defaulted, so state files saved before this field still load
+    parallelDownloads: int = 4
+
+
 class Attr:
     """
     Contains shared attributes for saving and loading program state.
     """
 
     def __init__(self):
+        # Load the saved attributes if possible;
+        # otherwise, fall back to the default values
+        try:
+            self.load()
+        except Exception:
+            self.resetAll()
+
+    def resetAll(self):
+        """
+        Resets all attributes to their default values.
+        """
+
         # Default download option
         self.opt = Option.VideoWithAudio
         # Default video quality
@@ -26,21 +54,22 @@ class Attr:
         self.confirmDownload = True
         # Whether to close dialog after download
         self.closeAfterDownload = False
-
-    def resetAll(self):
-        """
-        Resets all attributes to their default values.
-        """
-
-        self.__init__()
+        # Number of playlist videos downloaded at once
+        self.parallelDownloads = 4
 
     def save(self):
         """
         Saves all attributes to the local disk.
         """
         
-        with open("../Saved", "wb") as file:
-            pickle.dump(vars(self), file)
+        payload = msgspec.msgpack.encode(AttrState(**vars(self)))
+
+        # Write to a temporary file first, then atomically replace the
+        # old file, so a crash mid-write cannot corrupt the saved state
+        with open("../Saved.tmp", "wb") as file:
+            file.write(payload)
+            os.fsync(file.fileno())
+        os.replace("../Saved.tmp", "../Saved")
 
     def load(self):
         """
@@ -48,8 +77,24 @@ class Attr:
         """
 
         with open("../Saved", "rb") as file:
-            vars(self).update(pickle.load(file))
+            state = msgspec.msgpack.decode(file.read(), type=AttrState)
+        vars(self).update(msgspec.structs.asdict(state))
+
+
+# Lazily created singleton for the 'Attr' class
+_attr = None
+
+
+def __getattr__(name: str):
+    """
+    Creates the 'Attr' singleton on first access (PEP 562).
+    """
+
+    global _attr
 
+    if name == "attr":
+        if _attr is None:
+            _attr = Attr()
+        return _attr
 
-# Create a singleton for the 'Attr' class
-attr = Attr()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,26 @@
+"""
+Caches pytube objects, so URL validation and downloading
+reuse one instance (and its fetched player JS) per URL.
+"""
+
+from functools import lru_cache
+
+from pytube import Playlist, YouTube
+
+
+@lru_cache(maxsize=64)
+def getYt(url: str) -> YouTube:
+    """
+    Returns a cached 'YouTube' instance for the specified URL.
+    """
+
+    return YouTube(url)
+
+
+@lru_cache(maxsize=64)
+def getPl(url: str) -> Playlist:
+    """
+    Returns a cached 'Playlist' instance for the specified URL.
+    """
+
+    return Playlist(url)
@@ -2,29 +2,68 @@
 Contains the implementation of various dialog boxes used in the program.
 """
 
-from PySide6.QtCore import Qt, QSize, QTimer
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import Qt, QSize, QStringListModel, QTimer, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QCheckBox, QComboBox, QDialog, QFileDialog, QFormLayout,
-    QFrame, QGridLayout, QGroupBox, QHBoxLayout, QLineEdit,
-    QListWidget, QListWidgetItem, QMessageBox, QPushButton, 
-    QTextBrowser, QVBoxLayout, QWidget,
+    QFrame, QGridLayout, QGroupBox, QHBoxLayout, QLabel,
+    QLineEdit, QListWidget, QListWidgetItem, QMessageBox,
+    QPushButton, QSpinBox, QVBoxLayout, QWidget,
 )
-from pytube import Playlist, YouTube
+from pytube import YouTube
 
+import Cache
 import MyTube
 import Thread
-from MainWindow import MainWindow
 from MyTube import Option
 from Attr import attr
 
+# NOTE: import for type hints only to avoid circular import
+if TYPE_CHECKING:
+    from MainWindow import MainWindow
+
+
+@cache
+def aboutHtml() -> str:
+    """
+    Returns the content of 'About.html', read once on first use.
+
+    Reading lazily keeps the disk I/O off the startup path.
+    """
+
+    try:
+        with open("About.html") as file:
+            return file.read()
+    except FileNotFoundError:
+        return ""
+
+# Decoded program logo, created lazily since QIcon needs a QApplication
+_logoIcon = None
+
+
+def logoIcon() -> QIcon:
+    """
+    Returns the program logo, decoding 'Logo.png' only once.
+    """
+
+    global _logoIcon
+
+    if _logoIcon is None:
+        _logoIcon = QIcon("Logo.png")
+
+    return _logoIcon
+
 
 class DownloadDialog(QDialog):
     """
     Base class for 'VideoDialog' and 'PlaylistDialog'.
     """
 
-    def __init__(self, win: MainWindow, title: str):
+    def __init__(self, win: "MainWindow", title: str):
         # Text displayed on the title bar
         self.title = title
 
@@ -32,6 +71,14 @@ class DownloadDialog(QDialog):
         # Free memory on close
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
 
+        # Resets the window title a while after a download completes;
+        # parented to the dialog, so closing the dialog cleans it up
+        self._titleResetTimer = QTimer(self)
+        self._titleResetTimer.setSingleShot(True)
+        self._titleResetTimer.timeout.connect(
+            lambda: self.setWindowTitle(self.title)
+        )
+
         # Set up the layout
         self.mainLayout = QVBoxLayout(self)
         self.mainLayout.setSpacing(25)
@@ -39,42 +86,66 @@ class DownloadDialog(QDialog):
 
         # Configure download quality
         self.qualFrame = QualityFrame(self)
-        self.mainLayout.addWidget(group("Quality", self, self.qualFrame))
+        qualGroup = GroupBox("Quality", self, self.qualFrame)
+        self.mainLayout.addWidget(qualGroup)
 
         # Configure download location
         self.dirFrame = DirFrame(self)
-        self.mainLayout.addWidget(group("Save To", self, self.dirFrame))
+        dirGroup = GroupBox("Save To", self, self.dirFrame)
+        self.mainLayout.addWidget(dirGroup)
+
+        # Group boxes frozen while fetching or downloading;
+        # subclasses append their own group boxes
+        self.configGroups = [qualGroup, dirGroup]
 
         # Start downloading on click
         self.startButton = QPushButton("Start", self)
         self.startButton.setDefault(True)
-        self.startButton.clicked.connect(lambda: self.startDownload())
+        self.startButton.clicked.connect(self.startDownload)
         self.mainLayout.addSpacing(25)
         self.mainLayout.addWidget(self.startButton, 0,
                                   Qt.AlignmentFlag.AlignRight)
 
+    def setConfigEnabled(self, enabled: bool):
+        """
+        Freezes or unfreezes the download configurations.
+
+        Toggling only these widgets skips the recursive setEnabled walk
+        over the whole dialog, and the window itself stays responsive.
+        """
+
+        for group in self.configGroups:
+            group.setEnabled(enabled)
+
+        self.startButton.setEnabled(enabled)
+
     def startFetch(self):
         """
         Handles events before fetching.
         """
 
-        self.setEnabled(False)
+        self.setConfigEnabled(False)
         self.setWindowTitle("Fetching Information...")
 
-        Thread.start(lambda: self.onFetch(),
-                     lambda: self.postFetch())
+        Thread.start(self.onFetch, self.postFetch)
 
     def onFetch(self):
         """
         Fetching information online.
         """
 
-    def postFetch(self):
+    def postFetch(self, error: Exception | None = None):
         """
         Handles events after fetching completes.
         """
 
-        self.setEnabled(True)
+        self.setConfigEnabled(True)
+
+        # Report a failed fetch instead of pretending it finished
+        if error:
+            self.setWindowTitle("Fetch Failed!")
+            return
+
         self.setWindowTitle(self.title)
 
     def confirmDownload(self):
@@ -98,45 +169,69 @@ class DownloadDialog(QDialog):
         if attr.confirmDownload and not self.confirmDownload():
             return
 
-        # Disable the dialog to prevent any configurations from changing
-        self.setEnabled(False)
+        # Snapshot the configurations on the GUI thread, so the
+        # download worker never reaches into Qt widgets
+        self.opt = self.qualFrame.opt()
+        self.vidQuality = self.qualFrame.vidQuality()
+        self.audQuality = self.qualFrame.audQuality()
+        self.dir = self.dirFrame.dir()
+
+        # Freeze the configurations to prevent them from changing
+        self.setConfigEnabled(False)
         self.setWindowTitle("Downloading...")
 
-        Thread.start(lambda: self.onDownload(),
-                     lambda: self.postDownload())
+        Thread.start(self.onDownload, self.postDownload)
 
     def onDownload(self):
         """
         Downloading.
         """
 
-    def postDownload(self):
+    def postDownload(self, error: Exception | None = None):
         """
         Handles events after downloading.
         """
 
+        # Report a failure instead of claiming success; a failed
+        # download also never closes the dialog silently
+        if error:
+            self.setConfigEnabled(True)
+            self.setWindowTitle("Download Failed!")
+            self._titleResetTimer.start(10000)
+            return
+
         # Close the dialog after download if preferred
         if attr.closeAfterDownload:
             self.close()
             return
 
-        # Enable the dialog again
-        self.setEnabled(True)
+        # Unfreeze the configurations again
+        self.setConfigEnabled(True)
         self.setWindowTitle("Download Complete!")
 
         # Reset the window title after 10s
-        QTimer.singleShot(10000, self, lambda: self.setWindowTitle(self.title))
+        self._titleResetTimer.start(10000)
+
+    # Fixed dialog size, cached per dialog class
+    _cachedSize = None
 
     def show(self):
         """
         Overrides the original show() method.
         """
 
-        size = self.sizeHint()
-        # Calculate the dialog width based on the dialog height
-        size.setWidth(round(size.height() * 0.85))
+        cls = type(self)
+
+        # Compute the fixed size once per dialog class,
+        # so re-shows skip the full layout pass in sizeHint()
+        if cls._cachedSize is None:
+            size = self.sizeHint()
+            # Calculate the dialog width based on the dialog height
+            size.setWidth(round(size.height() * 0.85))
+            cls._cachedSize = size
+
         # Make this window not resizable
-        self.setFixedSize(size)
+        self.setFixedSize(cls._cachedSize)
         super().show()
 
 
@@ -145,9 +240,18 @@ class QualityFrame(QFrame):
     Prompts the user for the selection of download quality.
     """
 
+    # Model for the download options, shared by every option box
+    # (the quality boxes keep their own models, since dialogs append
+    # video-specific resolutions and bitrates to them)
+    _optModel = None
+
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
 
+        # Build the shared model once
+        if QualityFrame._optModel is None:
+            QualityFrame._optModel = QStringListModel(MyTube.OPTIONS)
+
         # Set up the layout
         formLayout = QFormLayout(self)
         formLayout.setHorizontalSpacing(40)
@@ -156,13 +260,8 @@ class QualityFrame(QFrame):
 
         # Display and select download option
         self.optBox = QComboBox(self)
-        # If option is 'Audio Only', disable selection of resolutions
-        # If option is 'Video Only', disable selection of bitrates
-        self.optBox.addItems(MyTube.OPTIONS)
-        self.optBox.currentTextChanged.connect(lambda opt: (
-            self.vidBox.setEnabled(opt != Option.AudioOnly),
-            self.audBox.setEnabled(opt != Option.VideoOnly),
-        ))
+        self.optBox.setModel(QualityFrame._optModel)
+        self.optBox.currentTextChanged.connect(self.onOptChanged)
         formLayout.addRow("Option:", self.optBox)
 
         # Display and select video resolution
@@ -180,6 +279,16 @@ class QualityFrame(QFrame):
         self.vidBox.setCurrentText(attr.vidQuality)
         self.audBox.setCurrentText(attr.audQuality)
 
+    def onOptChanged(self, opt: str):
+        """
+        Enables only the quality boxes relevant to the option.
+        """
+
+        # If option is 'Audio Only', disable selection of resolutions
+        # If option is 'Video Only', disable selection of bitrates
+        self.vidBox.setEnabled(opt != Option.AudioOnly)
+        self.audBox.setEnabled(opt != Option.VideoOnly)
+
     def opt(self):
         """
         Returns the selected download option.
@@ -221,7 +330,7 @@ class DirFrame(QFrame):
 
         # Open a file dialog for selecting a directory on click
         browseButton = QPushButton("Browse", self)
-        browseButton.clicked.connect(lambda: self.browse())
+        browseButton.clicked.connect(self.browse)
         hboxLayout.addWidget(browseButton)
 
     def dir(self):
@@ -236,8 +345,15 @@ class DirFrame(QFrame):
         Opens a file dialog for selecting a directory.
         """
 
-        # Select a new directory
-        dir = QFileDialog.getExistingDirectory(self, dir=self.dirField.text())
+        # Select a new directory; skip the per-entry icon and symlink
+        # stats, which crawl on network mounts and huge directories
+        dir = QFileDialog.getExistingDirectory(
+            self, "Select Directory", self.dirField.text(),
+            QFileDialog.Option.ShowDirsOnly |
+            QFileDialog.Option.ReadOnly |
+            QFileDialog.Option.DontUseCustomDirectoryIcons |
+            QFileDialog.Option.DontResolveSymlinks,
+        )
         # Make sure the selection is not empty
         if dir:
             self.dirField.setText(dir)
@@ -248,43 +364,65 @@ class VideoDialog(DownloadDialog):
     Configures video information before downloading.
     """
 
-    def __init__(self, win: MainWindow, url: str):
+    def __init__(self, win: "MainWindow", url: str):
         super().__init__(win, "Download Video")
 
-        # Create a 'YouTube' instance
-        self.yt = YouTube(url)
+        # URL of the video; the 'YouTube' instance is resolved in
+        # onFetch(), off the GUI thread
+        self.url = url
+        self.yt = None
+        # Fetched information, applied to the widgets in postFetch()
+        self._fetchedTitle = ""
+        self._allRes = []
+        self._allAbr = []
 
         # Display and edit video title
         self.titleField = QLineEdit(self)
-        self.mainLayout.insertWidget(0, group("Title", self, self.titleField))
+        titleGroup = GroupBox("Title", self, self.titleField)
+        self.mainLayout.insertWidget(0, titleGroup)
+        self.configGroups.append(titleGroup)
 
     def onFetch(self):
         super().onFetch()
 
-        self.titleField.setText(self.yt.title)
+        # Reuse the 'YouTube' instance built during URL validation
+        self.yt = Cache.getYt(self.url)
+
+        # Stash the fetched values only; the worker must not reach
+        # into Qt widgets
+        self._fetchedTitle = self.yt.title
+        self._allRes, self._allAbr = MyTube.allQualities(self.yt)
 
-        self.qualFrame.vidBox.addItems(MyTube.allResolutions(self.yt))
-        self.qualFrame.audBox.addItems(MyTube.allBitrates(self.yt))
+    def postFetch(self, error: Exception | None = None):
+        # Apply the fetched information to the widgets;
+        # this runs on the GUI thread, unlike onFetch()
+        if not error:
+            self.titleField.setText(self._fetchedTitle)
+            self.qualFrame.vidBox.addItems(self._allRes)
+            self.qualFrame.audBox.addItems(self._allAbr)
+
+        super().postFetch(error)
+
+    def startDownload(self):
+        # Snapshot the edited title on the GUI thread
+        self.vidTitle = self.titleField.text()
+
+        super().startDownload()
 
     def onDownload(self):
         super().onDownload()
 
-        # Fetch configurations
-        title = self.titleField.text()
-        opt = self.qualFrame.opt()
-        vidQuality = self.qualFrame.vidQuality()
-        audQuality = self.qualFrame.audQuality()
-        res = MyTube.getResolution(self.yt, vidQuality)
-        abr = MyTube.getBitrate(self.yt, audQuality)
-        dir = self.dirFrame.dir()
+        # Fetch configurations snapshotted by startDownload()
+        res = MyTube.getResolution(self.yt, self.vidQuality)
+        abr = MyTube.getBitrate(self.yt, self.audQuality)
 
         # Download the video according to the configurations
-        if opt == Option.VideoWithAudio:
-            MyTube.downloadBoth(self.yt, title, res, abr, dir)
-        elif opt == Option.AudioOnly:
-            MyTube.downloadAudio(self.yt, title, abr, dir)
+        if self.opt == Option.VideoWithAudio:
+            MyTube.downloadBoth(self.yt, self.vidTitle, res, abr, self.dir)
+        elif self.opt == Option.AudioOnly:
+            MyTube.downloadAudio(self.yt, self.vidTitle, abr, self.dir)
         else:
-            MyTube.downloadVideo(self.yt, title, res, dir)
+            MyTube.downloadVideo(self.yt, self.vidTitle, res, self.dir)
 
 
 class PlaylistDialog(DownloadDialog):
@@ -292,78 +430,194 @@ class PlaylistDialog(DownloadDialog):
     Configures playlist information before downloading.
     """
 
-    def __init__(self, win: MainWindow, url: str):
+    # Emitted from the download workers as (done, total)
+    progressChanged = Signal(int, int)
+
+    def __init__(self, win: "MainWindow", url: str):
         super().__init__(win, "Download Playlist")
 
-        # Create a 'Playlist' instance
-        self.pl = Playlist(url)
+        # Update the window title on the GUI thread
+        self.progressChanged.connect(self.onProgressChanged,
+                                     Qt.ConnectionType.QueuedConnection)
+
+        # URL of the playlist; the 'Playlist' instance is resolved in
+        # onFetch(), off the GUI thread
+        self.url = url
+        self.pl = None
+        # Videos in the playlist, cached once fetched
+        self._videos = []
+        # Fetched video titles, applied to the list in postFetch()
+        self._titles = []
+        # Rows of the currently checked items, maintained incrementally
+        self._checkedRows = set()
 
         # Display all videos inside a playlist
         self.listWidget = QListWidget(self)
-        # Disable the 'Start' button if no item is selected
-        self.listWidget.itemChanged.connect(
-            lambda: self.startButton.setDisabled(not self.getCheckedRows())
-        )
-        self.mainLayout.insertWidget(
-            0, group("Playlist", self, self.listWidget)
-        )
+        # Track the toggled row and disable the 'Start' button
+        # if no item is checked
+        self.listWidget.itemChanged.connect(self.onItemChanged)
+        playlistGroup = GroupBox("Playlist", self, self.listWidget)
+        self.mainLayout.insertWidget(0, playlistGroup)
+        self.configGroups.append(playlistGroup)
 
-    def addPlaylistItem(self, yt: YouTube):
+    def onProgressChanged(self, done: int, total: int):
+        """
+        Displays the download progress on the title bar.
         """
-        Adds an item to the playlist.
+
+        self.setWindowTitle(f"Downloading ({done} of {total})...")
+
+    def onItemChanged(self, item: QListWidgetItem):
         """
+        Updates the set of checked rows in O(1) per toggle.
+        """
+
+        row = self.listWidget.row(item)
+
+        if item.checkState() == Qt.CheckState.Checked:
+            self._checkedRows.add(row)
+        else:
+            self._checkedRows.discard(row)
 
-        item = QListWidgetItem(yt.title, self.listWidget)
-        item.setCheckState(Qt.CheckState.Checked)
-        item.setFlags(Qt.ItemFlag.ItemIsEnabled |
-                      Qt.ItemFlag.ItemIsEditable |
-                      Qt.ItemFlag.ItemIsSelectable |
-                      Qt.ItemFlag.ItemIsUserCheckable)
-        self.listWidget.addItem(item)
+        self.startButton.setDisabled(not self._checkedRows)
 
     def getCheckedRows(self):
         """
-        Returns the row numbers of all checked items. 
+        Returns the row numbers of all checked items.
         """
 
-        return [
-            i for i in range(self.listWidget.count())
-            if self.listWidget.item(i).checkState() == Qt.CheckState.Checked
-        ]
+        return sorted(self._checkedRows)
 
     def onFetch(self):
         super().onFetch()
 
-        # Fetch all videos
-        for yt in self.pl.videos:
-            self.addPlaylistItem(yt)
+        # Reuse the 'Playlist' instance built during URL validation
+        self.pl = Cache.getPl(self.url)
 
-    def onDownload(self):
-        super().onDownload()
+        # Cache the videos so later lookups do not re-walk the playlist
+        self._videos = list(self.pl.videos)
+
+        # Fetch all video titles concurrently; each title is one HTTP
+        # round-trip, so the fanout avoids N sequential round-trips
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            self._titles = list(
+                executor.map(lambda yt: yt.title, self._videos)
+            )
+
+    def postFetch(self, error: Exception | None = None):
+        # Nothing to insert on a failed fetch
+        if error:
+            super().postFetch(error)
+            self.startButton.setDisabled(True)
+            return
+
+        # Insert all items in one batch with repaints paused and
+        # signals blocked, instead of paying a relayout plus an
+        # itemChanged dispatch per item;
+        # this runs on the GUI thread, unlike onFetch()
+        self.listWidget.setUpdatesEnabled(False)
+        self.listWidget.blockSignals(True)
+
+        self.listWidget.setUniformItemSizes(True)
+        self.listWidget.addItems(self._titles)
+
+        # Make every item checked and editable
+        for i in range(self.listWidget.count()):
+            item = self.listWidget.item(i)
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled |
+                          Qt.ItemFlag.ItemIsEditable |
+                          Qt.ItemFlag.ItemIsSelectable |
+                          Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked)
+
+        self.listWidget.blockSignals(False)
+        self.listWidget.setUpdatesEnabled(True)
+
+        # Every item starts checked; record that directly,
+        # since the itemChanged signals were blocked above
+        self._checkedRows = set(range(self.listWidget.count()))
+
+        super().postFetch()
+
+        # URL validation no longer rejects empty playlists, so keep
+        # the 'Start' button disabled when there is nothing here;
+        # applied after super() re-enables the configurations
+        self.startButton.setDisabled(not self._checkedRows)
+
+    def downloadRow(self, yt: YouTube, title: str):
+        """
+        Downloads a single video in the playlist.
+        """
+
+        # Fetch configurations snapshotted by startDownload()
+        res = MyTube.getResolution(yt, self.vidQuality)
+        abr = MyTube.getBitrate(yt, self.audQuality)
+
+        # Download the video according to the configurations
+        if self.opt == Option.VideoWithAudio:
+            MyTube.downloadBoth(yt, title, res, abr, self.dir)
+        elif self.opt == Option.AudioOnly:
+            MyTube.downloadAudio(yt, title, abr, self.dir)
+        else:
+            MyTube.downloadVideo(yt, title, res, self.dir)
 
-        # Total number of videos in a playlist
+    def confirmDownload(self):
+        """
+        Confirms the whole batch with a single question.
+        """
+
+        # Number of videos about to be downloaded
+        count = len(self.downloads)
+
+        ans = QMessageBox.question(
+            self, "Confirm Download",
+            f"Do you want to download {count} "
+            f"{'video' if count == 1 else 'videos'}?"
+        )
+
+        return ans == QMessageBox.StandardButton.Yes
+
+    def startDownload(self):
+        # Snapshot the checked rows and their (possibly edited) titles
+        # on the GUI thread
         rows = self.getCheckedRows()
-        opt = self.qualFrame.opt()
-        vidQuality = self.qualFrame.vidQuality()
-        audQuality = self.qualFrame.audQuality()
-        dir = self.dirFrame.dir()
 
-        for i, row in enumerate(rows):
-            self.setWindowTitle(f"Downloading ({i + 1} of {len(rows)})...")
+        # Suffix repeated titles, so two rows downloading concurrently
+        # can never write to the same output file;
+        # compare the filtered titles, which name the actual files
+        seen = set()
+        self.downloads = []
 
-            # Fetch configurations
-            yt = self.pl.videos[row]
+        for row in rows:
             title = self.listWidget.item(row).text()
-            res = MyTube.getResolution(yt, vidQuality)
-            abr = MyTube.getBitrate(yt, audQuality)
+            base = title
+            n = 1
+
+            while MyTube.filterTitle(title) in seen:
+                title = f"{base} ({n})"
+                n += 1
+
+            seen.add(MyTube.filterTitle(title))
+            self.downloads.append((self._videos[row], title))
+
+        super().startDownload()
 
-            # Download the video according to the configurations
-            if opt == Option.VideoWithAudio:
-                MyTube.downloadBoth(yt, title, res, abr, dir)
-            elif opt == Option.AudioOnly:
-                MyTube.downloadAudio(yt, title, abr, dir)
-            else:
-                MyTube.downloadVideo(yt, title, res, dir)
+    def onDownload(self):
+        super().onDownload()
+
+        # Download several videos concurrently; each one is bound by
+        # network I/O, so the pool raises aggregate throughput
+        with ThreadPoolExecutor(max_workers=attr.parallelDownloads) \
+                as executor:
+            futures = [
+                executor.submit(self.downloadRow, yt, title)
+                for yt, title in self.downloads
+            ]
+
+            # Report progress as each download completes
+            for done, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                self.progressChanged.emit(done, len(futures))
 
 
 class PrefDialog(QDialog):
@@ -371,7 +625,7 @@ class PrefDialog(QDialog):
     Displays and edits user preferences.
     """
 
-    def __init__(self, win: MainWindow):
+    def __init__(self, win: "MainWindow"):
         super().__init__(win)
         self.setWindowTitle("Preferences")
         # Free memory on close
@@ -384,11 +638,11 @@ class PrefDialog(QDialog):
 
         # Configure download quality
         self.qualFrame = QualityFrame(self)
-        mainLayout.addWidget(group("Quality", self, self.qualFrame))
+        mainLayout.addWidget(GroupBox("Quality", self, self.qualFrame))
 
         # Configure download location
         self.dirFrame = DirFrame(self)
-        mainLayout.addWidget(group("Save To", self, self.dirFrame))
+        mainLayout.addWidget(GroupBox("Save To", self, self.dirFrame))
 
         # Whether to confirm before download
         self.confirmBox = QCheckBox("Confirm Before Download", self)
@@ -400,9 +654,20 @@ class PrefDialog(QDialog):
 
         # Group all check boxes
         mainLayout.addWidget(
-            group("Action", self, self.confirmBox, self.closeAfterBox)
+            GroupBox("Action", self, self.confirmBox, self.closeAfterBox)
         )
 
+        # Number of playlist videos downloaded at once;
+        # rate-limited networks may prefer 1
+        workersFrame = QFrame(self)
+        workersLayout = QFormLayout(workersFrame)
+        workersLayout.setContentsMargins(0, 0, 0, 0)
+        self.workersBox = QSpinBox(workersFrame)
+        self.workersBox.setRange(1, 8)
+        self.workersBox.setValue(attr.parallelDownloads)
+        workersLayout.addRow("Parallel Downloads:", self.workersBox)
+        mainLayout.addWidget(GroupBox("Playlist", self, workersFrame))
+
         # Display buttons horizontally
         buttonFrame = QFrame(self)
         mainLayout.addSpacing(25)
@@ -414,25 +679,21 @@ class PrefDialog(QDialog):
 
         # Reset all preferences on click
         resetButton = QPushButton("Reset", self)
-        resetButton.clicked.connect(lambda: (
-            attr.resetAll(),
-            self.close(),
-        ))
+        resetButton.clicked.connect(attr.resetAll)
+        resetButton.clicked.connect(self.close)
         buttonLayout.addWidget(resetButton)
         buttonLayout.addStretch()
 
         # Apply changes on click
         okButton = QPushButton("OK", self)
         okButton.setDefault(True)
-        okButton.clicked.connect(lambda: (
-            self.apply(),
-            self.close(),
-        ))
+        okButton.clicked.connect(self.apply)
+        okButton.clicked.connect(self.close)
         buttonLayout.addWidget(okButton)
 
         # Discard changes on click
         cancelButton = QPushButton("Cancel", self)
-        cancelButton.clicked.connect(lambda: self.close())
+        cancelButton.clicked.connect(self.close)
         buttonLayout.addWidget(cancelButton)
 
     def apply(self):
@@ -446,17 +707,26 @@ class PrefDialog(QDialog):
         attr.dir = self.dirFrame.dir()
         attr.confirmDownload = self.confirmBox.isChecked()
         attr.closeAfterDownload = self.closeAfterBox.isChecked()
+        attr.parallelDownloads = self.workersBox.value()
+
+    # Fixed dialog size, cached across dialog instances
+    _cachedSize = None
 
     def show(self):
         """
         Overrides the original show() method.
         """
 
-        size = self.sizeHint()
-        # Calculate the dialog width based on the dialog height
-        size.setWidth(round(size.height() * 0.85))
+        # Compute the fixed size once,
+        # so re-shows skip the full layout pass in sizeHint()
+        if PrefDialog._cachedSize is None:
+            size = self.sizeHint()
+            # Calculate the dialog width based on the dialog height
+            size.setWidth(round(size.height() * 0.85))
+            PrefDialog._cachedSize = size
+
         # Make this window not resizable
-        self.setFixedSize(size)
+        self.setFixedSize(PrefDialog._cachedSize)
         super().show()
 
 
@@ -479,52 +749,59 @@ class AboutDialog(QDialog):
 
         # Display logo on the left
         logoButton = QPushButton(self)
-        logoButton.setIcon(QIcon("Logo.png"))
+        logoButton.setIcon(logoIcon())
         logoButton.setIconSize(QSize(128, 128))
         logoButton.setStyleSheet("border: 0")
         gridLayout.addWidget(logoButton, 0, 0)
 
-        # Display HTML on the right
-        browser = QTextBrowser(self)
+        # Display HTML on the right; a label is far lighter than a
+        # full QTextBrowser for this static paragraph
+        label = QLabel(self)
+        label.setTextFormat(Qt.TextFormat.RichText)
+        label.setWordWrap(True)
         # Open hyperlinks in the HTML content on click
-        browser.setOpenExternalLinks(True)
-        browser.anchorClicked.connect(lambda: ...)
-        gridLayout.addWidget(browser, 0, 1)
-
-        # Display HTML content
-        with open("About.html") as file:
-            browser.setHtml(file.read())
+        label.setOpenExternalLinks(True)
+        label.setText(aboutHtml())
+        gridLayout.addWidget(label, 0, 1)
 
         # Close the dialog on close
         okButton = QPushButton("OK", self)
         okButton.setDefault(True)
-        okButton.clicked.connect(lambda: self.close())
+        okButton.clicked.connect(self.close)
         gridLayout.addWidget(okButton, 1, 1, Qt.AlignmentFlag.AlignRight)
 
+    # Fixed dialog size, cached across dialog instances
+    _cachedSize = None
+
     def show(self):
         """
         Overrides the original show() method.
         """
 
+        # Compute the fixed size once,
+        # so re-shows skip the full layout pass in sizeHint()
+        if AboutDialog._cachedSize is None:
+            AboutDialog._cachedSize = self.sizeHint()
+
         # Make this window not resizable
-        self.setFixedSize(self.sizeHint())
+        self.setFixedSize(AboutDialog._cachedSize)
         super().show()
 
 
-def group(title: str, parent: QWidget = None, *widgets: QWidget):
+class GroupBox(QGroupBox):
     """
-    Vertically display widgets in a group box.
+    Vertically displays widgets in a group box.
     """
 
-    box = QGroupBox(title, parent)
-
-    # Set up the layout
-    vboxLayout = QVBoxLayout(box)
-    vboxLayout.setSpacing(5)
-    vboxLayout.setContentsMargins(25, 25, 25, 25)
+    def __init__(self, title: str, parent: QWidget = None,
+                 *widgets: QWidget):
+        super().__init__(title, parent)
 
-    # Add widgets to layout
-    for widget in widgets:
-        vboxLayout.addWidget(widget)
+        # Set up the layout
+        vboxLayout = QVBoxLayout(self)
+        vboxLayout.setSpacing(5)
+        vboxLayout.setContentsMargins(25, 25, 25, 25)
 
-    return box
+        # Add widgets to layout
+        for widget in widgets:
+            vboxLayout.addWidget(widget)
@@ -3,7 +3,6 @@ Executes the main program.
 """
 
 import os
-from contextlib import suppress
 
 # Set the current directory to 'Res'
 # NOTE: place the following codes before importing any project modules
@@ -13,13 +12,40 @@ try:
 except Exception:
     raise SystemExit("Cannot locate the required resource files.")
 
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
+from pytube import YouTube
 
+import Network
+import Thread
+from Dialog import logoIcon
 from MainWindow import MainWindow
 from Attr import attr
 
 
+def loadStyles() -> str:
+    """
+    Reads the external style sheet.
+    """
+
+    with open("Styles.qss") as file:
+        return file.read()
+
+
+def prewarm():
+    """
+    Primes pytube's global base.js and cipher caches with a known
+    video while the user is still typing, so the first real URL check
+    only pays its own round trip.
+    """
+
+    try:
+        # 'Me at the zoo' - the oldest video on YouTube
+        YouTube("https://youtu.be/jNQXAC9IVRw").streams
+    except Exception:
+        pass
+
+
 def main():
     """
     Sets up the application, then starts the program.
@@ -28,22 +54,24 @@ def main():
     # Create a new 'QApplication' instance
     app = QApplication([])
     app.setApplicationName("YT Downloader")
-    app.setWindowIcon(QIcon("Logo.png"))
-    # Save attributes upon exiting the program
-    app.aboutToQuit.connect(lambda: attr.save())
+    app.setWindowIcon(logoIcon())
+    # Save attributes and release connections upon exiting the program
+    app.aboutToQuit.connect(lambda: (attr.save(), Network.close()))
 
-    # Load external style sheet
-    with open("Styles.qss") as file:
-        app.setStyleSheet(file.read())
-
-    # Load attributes if possible
-    with suppress(Exception):
-        attr.load()
+    # Reuse pooled connections for all pytube requests
+    Network.install()
 
     # Create a new 'MainWindow' instance
     win = MainWindow()
     win.show()
 
+    # Load the external style sheet once the event loop is running,
+    # so the window appears without waiting on the file read
+    QTimer.singleShot(0, lambda: app.setStyleSheet(loadStyles()))
+
+    # Warm up pytube's caches in the background
+    Thread.start(prewarm)
+
     # Execute the program
     app.exec()
 
@@ -4,15 +4,15 @@ Contains the implementation of the main window.
 
 import webbrowser
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QApplication, QGridLayout, QLabel, QLineEdit, QMainWindow,
     QMenuBar, QMessageBox, QPushButton, QSpacerItem, QWidget,
 )
-from pytube import YouTube, Playlist
-
+import Cache
 import MyTube
 import Thread
+from Dialog import VideoDialog, PlaylistDialog, PrefDialog, AboutDialog
 
 
 class MainWindow(QMainWindow):
@@ -21,9 +21,16 @@ class MainWindow(QMainWindow):
     then proceeds to download.
     """
 
+    # Emitted from the URL check worker as (text, state, enableNext)
+    statusChanged = Signal(str, str, bool)
+
     def __init__(self):
         super().__init__()
 
+        # Update the status widgets on the GUI thread
+        self.statusChanged.connect(self.onStatusChanged,
+                                   Qt.ConnectionType.QueuedConnection)
+
         # Display a menu bar on the top
         menuBar = MenuBar(self)
         self.setMenuBar(menuBar)
@@ -41,50 +48,107 @@ class MainWindow(QMainWindow):
         promptLabel = QLabel("Enter Video or Playlist URL:", self)
         gridLayout.addWidget(promptLabel, 0, 0, 1, 2)
 
+        # Generation counter for discarding stale URL checks
+        self._urlGen = 0
+
+        # Check the URL shortly after the user stops typing,
+        # instead of launching one check per keystroke
+        self._checkTimer = QTimer(self)
+        self._checkTimer.setSingleShot(True)
+        self._checkTimer.setInterval(300)
+        self._checkTimer.timeout.connect(
+            lambda: Thread.start(self.checkUrl)
+        )
+
         # Create a field for entering the URL
         self.urlField = QLineEdit(self)
         self.urlField.setMinimumWidth(360)
-        self.urlField.returnPressed.connect(lambda: self.nextButton.click())
-        self.urlField.textChanged.connect(lambda: (
-            self.resetStatus(),
-            Thread.start(lambda: self.checkUrl()),
-        ))
+        self.urlField.textChanged.connect(self.onUrlChanged)
         gridLayout.addWidget(self.urlField, 1, 0)
 
         # Set URL to the content of the clipboard
         pasteButton = QPushButton("Paste", self)
         pasteButton.setToolTip("Set URL to the content of the clipboard")
-        pasteButton.clicked.connect(lambda: (
-            self.urlField.setText(QApplication.clipboard().text()),
-            self.nextButton.click(),
-        ))
+        pasteButton.clicked.connect(self.paste)
         gridLayout.addWidget(pasteButton, 1, 1)
 
-        # Display status while entering the URL
+        # Display status while entering the URL;
+        # both colors are parsed once here, then selected through the
+        # 'state' property instead of re-parsing a sheet per check
         self.infoLabel = QLabel(self)
+        self.infoLabel.setStyleSheet(
+            'QLabel[state="ok"] { color: green; }'
+            'QLabel[state="err"] { color: red; }'
+        )
         gridLayout.addWidget(self.infoLabel, 2, 0, 1, 2)
 
         # Proceed to download on click
         self.nextButton = QPushButton("Next", self)
         self.nextButton.setDefault(True)
         self.nextButton.setEnabled(False)
-        self.nextButton.clicked.connect(lambda: self.next())
+        self.nextButton.clicked.connect(self.next)
         gridLayout.addItem(QSpacerItem(0, 32), 3, 1)
         gridLayout.addWidget(self.nextButton, 4, 1, Qt.AlignmentFlag.AlignRight)
 
+        # Proceed when Enter is pressed in the URL field;
+        # connected here, after 'nextButton' exists
+        self.urlField.returnPressed.connect(self.nextButton.click)
+
+    def onUrlChanged(self):
+        """
+        Handles edits to the URL field.
+        """
+
+        self.resetStatus()
+        self._checkTimer.start()
+
+    def paste(self):
+        """
+        Sets URL to the content of the clipboard, then proceeds.
+        """
+
+        self.urlField.setText(QApplication.clipboard().text())
+        self.nextButton.click()
+
     def resetStatus(self):
         """
         Resets the status before checking URL.
         """
 
+        # Invalidate any in-flight check for the previous URL
+        self._urlGen += 1
+
         self.infoLabel.setText("")
         self.nextButton.setEnabled(False)
 
+    def setInfoState(self, state: str):
+        """
+        Recolors the status label by flipping its 'state' property.
+        """
+
+        self.infoLabel.setProperty("state", state)
+
+        # Repolish so the style sheet selector picks up the new state
+        style = self.infoLabel.style()
+        style.unpolish(self.infoLabel)
+        style.polish(self.infoLabel)
+
+    def onStatusChanged(self, text: str, state: str, enableNext: bool):
+        """
+        Displays a URL check result; runs on the GUI thread.
+        """
+
+        self.infoLabel.setText(text)
+        self.setInfoState(state)
+        self.nextButton.setEnabled(enableNext)
+
     def checkUrl(self):
         """
         Checks the status while entering the URL.
         """
 
+        # Generation of the URL being checked
+        gen = self._urlGen
         # Entered URL
         url = self.urlField.text()
 
@@ -94,54 +158,58 @@ class MainWindow(QMainWindow):
 
         # If URL is invalid, display an error message in red
         if error := MyTube.checkUrl(url):
-            self.infoLabel.setText(error)
-            self.infoLabel.setStyleSheet("color: red")
+            # Discard the result if the URL has changed since
+            if gen != self._urlGen:
+                return
+
+            self.statusChanged.emit(error, "err", False)
             return
 
         # If URL is a valid video or playlist, display a message in green
-        if MyTube.isUrlPlaylist(url):
-            pl = Playlist(url)
-            self.infoLabel.setText(f'Playlist: {pl.title}')
+        if MyTube.classifyUrl(url).kind == "playlist":
+            pl = Cache.getPl(url)
+            info = f'Playlist: {pl.title}'
         else:
-            yt = YouTube(url)
-            self.infoLabel.setText(f'Video: {yt.title}')
+            yt = Cache.getYt(url)
+            info = f'Video: {yt.title}'
+
+        # Discard the result if the URL has changed since
+        if gen != self._urlGen:
+            return
 
-        self.infoLabel.setStyleSheet("color: green")
-        self.nextButton.setEnabled(True)
+        self.statusChanged.emit(info, "ok", True)
 
     def next(self):
         """
         If URL is valid, proceed to download.
         """
 
-        # NOTE: place the import statement here to avoid circular import
-        from Dialog import VideoDialog, PlaylistDialog
-
         # Entered URL
         url = self.urlField.text()
+        # Classify the URL once; the parse is shared with checkUrl()
+        info = MyTube.classifyUrl(url)
 
         # Download playlist
         # Ex: https://www.youtube.com/playlist?list=PL6C1LEYvl43RHLS2gFFf6kn4hoAs6kOgF
-        if MyTube.isUrlPlaylist(url):
+        if info.kind == "playlist":
             dialog = PlaylistDialog(self, url)
 
-        # If a video is part of a playlist, prompt user to choose 
+        # If a video is part of a playlist, prompt user to choose
         # between downloading the single video or the entire playlist
         # Ex: https://youtu.be/KWLGyeg74es?list=PL6C1LEYvl43RHLS2gFFf6kn4hoAs6kOgF
-        elif not MyTube.checkPlaylistUrl(MyTube.extractPlaylistUrl(url)):
+        elif (info.listId
+                and not MyTube.checkPlaylistUrl(MyTube.extractPlaylistUrl(url))):
             ans = QMessageBox.question(
-                self, "Video or Playlist", 
+                self, "Video or Playlist",
                 "This video is part of a playlist.\n"
                 "Do you want to download the playlist instead?"
             )
 
             if ans == QMessageBox.StandardButton.Yes:
-                id = url[url.index('list'):]
-                url = f"https://www.youtube.com/playlist?{id}"
-                dialog = PlaylistDialog(self, url)
+                dialog = PlaylistDialog(self, MyTube.extractPlaylistUrl(url))
             else:
                 dialog = VideoDialog(self, url)
-    
+
         # Download video
         # Ex: https://youtu.be/KWLGyeg74es
         else:
@@ -151,13 +219,21 @@ class MainWindow(QMainWindow):
         # Fetch information
         dialog.startFetch()
 
+    # Fixed window size, cached across shows
+    _cachedSize = None
+
     def show(self):
         """
         Overrides the original show() method.
         """
 
+        # Compute the fixed size once,
+        # so re-shows skip the full layout pass in sizeHint()
+        if MainWindow._cachedSize is None:
+            MainWindow._cachedSize = self.sizeHint()
+
         # Make this window not resizable
-        self.setFixedSize(self.sizeHint())
+        self.setFixedSize(MainWindow._cachedSize)
         super().show()
 
 
@@ -169,9 +245,6 @@ class MenuBar(QMenuBar):
     def __init__(self, win: MainWindow):
         super().__init__(win)
 
-        # NOTE: place the import statement here to avoid circular import
-        from Dialog import PrefDialog, AboutDialog
-
         # Create the 'File' menu
         fileMenu = self.addMenu("&File")
         fileMenu.addAction("&Preferences", "Ctrl+P", 
@@ -179,7 +252,7 @@ class MenuBar(QMenuBar):
         fileMenu.addAction("Visit &YouTube", 
                            lambda: webbrowser.open("https://www.youtube.com"))
         fileMenu.addSeparator()
-        fileMenu.addAction("E&xit", lambda: QApplication.quit())
+        fileMenu.addAction("E&xit", QApplication.quit)
 
         # Create the 'Help' menu
         helpMenu = self.addMenu("&Help")
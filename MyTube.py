@@ -3,11 +3,19 @@ Contains utilities for configuring and downloading a YouTube video.
 """
 
 import os
-import uuid
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from tempfile import TemporaryDirectory
+from dataclasses import dataclass
+from functools import lru_cache
 from urllib.error import HTTPError
 
 import pytube.exceptions as ex
-from pytube import YouTube, Playlist, Stream
+from pytube import YouTube, Stream
+
+import Cache
 
 
 class Option:
@@ -30,12 +38,64 @@ class Quality:
     Lowest = "Lowest"
 
 
+# Compiled patterns for a quick syntactic check, so half-typed URLs
+# are rejected without any network I/O
+_HOST_RE = re.compile(
+    r"^(?:https?://)?(?:www\.|m\.)?(?:youtube\.com|youtu\.be)/"
+)
+_VIDEO_URL_RE = re.compile(
+    r"(?:v=|youtu\.be/|/shorts/|/embed/|/live/)([A-Za-z0-9_-]{11})"
+)
+_PLAYLIST_URL_RE = re.compile(r"[?&]list=([A-Za-z0-9_-]+)")
+_PLAYLIST_PAGE_RE = re.compile(r"/playlist\?")
+
+
 def isUrlPlaylist(url: str) -> bool:
     """
-    Checks whether a URL is a YouTube playlist.
+    Checks whether a URL is a YouTube playlist page.
+    """
+
+    return bool(_PLAYLIST_PAGE_RE.search(url))
+
+
+@dataclass(frozen=True)
+class UrlInfo:
+    """
+    Classification of a YouTube URL, parsed in a single pass.
     """
 
-    return "playlist" in url
+    # One of 'video', 'playlist' or 'invalid'
+    kind: str
+    # 11-character video ID, if present
+    videoId: str | None = None
+    # Playlist ID from the 'list' parameter, if present
+    listId: str | None = None
+
+
+@lru_cache(maxsize=256)
+def classifyUrl(url: str) -> UrlInfo:
+    """
+    Classifies the specified URL as a video, a playlist or invalid.
+    """
+
+    # Reject non-YouTube hosts outright, so look-alike URLs
+    # (e.g. a search result mentioning 'playlist') go nowhere
+    if not _HOST_RE.match(url):
+        return UrlInfo("invalid")
+
+    video = _VIDEO_URL_RE.search(url)
+    playlist = _PLAYLIST_URL_RE.search(url)
+    videoId = video.group(1) if video else None
+    listId = playlist.group(1) if playlist else None
+
+    if isUrlPlaylist(url):
+        kind = "playlist" if listId else "invalid"
+    elif videoId:
+        kind = "video"
+    else:
+        kind = "invalid"
+
+    return UrlInfo(kind, videoId, listId)
 
 
 def checkUrl(url: str) -> str | None:
@@ -45,7 +105,13 @@ def checkUrl(url: str) -> str | None:
     Returns a text message if an error occurred; otherwise, return None.
     """
 
-    if isUrlPlaylist(url):
+    info = classifyUrl(url)
+
+    # Reject syntactically incomplete URLs before going online
+    if info.kind == "invalid":
+        return "Invalid URL!"
+
+    if info.kind == "playlist":
         return checkPlaylistUrl(url)
 
     return checkVideoUrl(url)
@@ -55,11 +121,16 @@ def checkVideoUrl(url: str) -> str | None:
     """
     Checks whether the specified URL is a valid YouTube video.
 
+    Deliberately not memoized: a transient network failure must not
+    pin an error message for the rest of the session. Re-checking a
+    valid URL is near-free anyway, since Cache.getYt() returns the
+    same instance with its pages already fetched.
+
     Returns a text message if an error occurred; otherwise, return None.
     """
 
     try:
-        yt = YouTube(url)
+        yt = Cache.getYt(url)
         if yt.age_restricted:
             raise ex.AgeRestrictedError(yt.video_id)
         yt.check_availability()
@@ -87,15 +158,17 @@ def checkPlaylistUrl(url: str) -> str | None:
     """
     Checks whether the specified URL is a valid YouTube playlist.
 
+    Deliberately not memoized, for the same reason as checkVideoUrl().
+
     Returns a text message if an error occurred; otherwise, return None.
     """
 
     try:
-        pl = Playlist(url)
-        if pl.title and not pl.videos:
-            return "Playlist must not be empty!"
+        # Probe only the title, which costs a single page fetch;
+        # enumerating the videos is deferred to the playlist dialog
+        Cache.getPl(url).title
     except (KeyError, HTTPError):
-        return "Invalid URL! Make sure the playlist is public and not empty."
+        return "Invalid URL! Make sure the playlist is public."
 
 
 def isVideoInPlaylist(url: str) -> bool:
@@ -103,30 +176,81 @@ def isVideoInPlaylist(url: str) -> bool:
     Checks whether a video is part of a playlist.
     """
 
-    return "list" in url
+    return classifyUrl(url).listId is not None
 
 
+@lru_cache(maxsize=256)
 def extractPlaylistUrl(url: str) -> str:
     """
     Attempts to extract the playlist URL from a video URL.
     """
 
-    if isVideoInPlaylist(url):
-        id = url[url.index("list"):]
-        return f"https://www.youtube.com/playlist?{id}"
-    
+    if id := classifyUrl(url).listId:
+        return f"https://www.youtube.com/playlist?list={id}"
+
     return url
 
 
-def filterTitle(title: str, illegals="<>:\"/\\|?*") -> str:
+# Maps each illegal file name character to an underscore (_)
+_ILLEGAL_TABLE = str.maketrans(dict.fromkeys("<>:\"/\\|?*", "_"))
+
+
+def filterTitle(title: str) -> str:
     """
-    Replaces all specified illegal characters with underscores (_).
+    Replaces all illegal file name characters with underscores (_).
     """
 
-    for char in illegals:
-        title = title.replace(char, "_")
+    return title.translate(_ILLEGAL_TABLE)
 
-    return title
+
+def streamIndex(yt: YouTube) -> tuple[dict[str, Stream], dict[str, Stream]]:
+    """
+    Returns the video streams indexed by resolution and the audio
+    streams indexed by bitrate.
+
+    Both tables are built in a single pass over 'yt.streams' and cached
+    on the 'YouTube' instance, so repeated calls (e.g. fetch, then
+    download) walk the stream list only once.
+    """
+
+    # Return the cached tables if available
+    if hasattr(yt, "_resIndex"):
+        return yt._resIndex, yt._abrIndex
+
+    # Video streams keyed by resolution
+    resIndex = {}
+    # Audio streams keyed by bitrate
+    abrIndex = {}
+
+    # Partition the streams into video and audio in one traversal,
+    # keeping the first stream per key to match StreamQuery.filter()
+    for stream in yt.streams:
+        if stream.includes_video_track and not stream.includes_audio_track:
+            resIndex.setdefault(stream.resolution, stream)
+        elif stream.includes_audio_track and not stream.includes_video_track:
+            abrIndex.setdefault(stream.abr, stream)
+
+    yt._resIndex = resIndex
+    yt._abrIndex = abrIndex
+    return resIndex, abrIndex
+
+
+def allQualities(yt: YouTube) -> tuple[list[str], list[str]]:
+    """
+    Returns all available video resolutions and audio bitrates
+    of the specified video.
+    """
+
+    # Return the cached qualities if available
+    if hasattr(yt, "_allRes"):
+        return yt._allRes, yt._allAbr
+
+    resIndex, abrIndex = streamIndex(yt)
+
+    # Sort based on the integer part (without the ending 'p' / 'kbps')
+    yt._allRes = sorted(resIndex, key=lambda res: int(res[:-1]), reverse=True)
+    yt._allAbr = sorted(abrIndex, key=lambda abr: int(abr[:-4]), reverse=True)
+    return yt._allRes, yt._allAbr
 
 
 def allResolutions(yt: YouTube) -> list[str]:
@@ -134,12 +258,7 @@ def allResolutions(yt: YouTube) -> list[str]:
     Returns all available video resolutions of the specified video.
     """
 
-    # All video streams
-    streams = yt.streams.filter(only_video=True)
-    # Unsorted resolutions of the video streams
-    allRes = {stream.resolution for stream in streams}
-    # Sort based on the integer part (without the ending 'p')
-    return sorted(allRes, key=lambda res: int(res[:-1]), reverse=True)
+    return allQualities(yt)[0]
 
 
 def allBitrates(yt: YouTube) -> list[str]:
@@ -147,12 +266,7 @@ def allBitrates(yt: YouTube) -> list[str]:
     Returns all available audio bitrates of the specified video.
     """
 
-    # All audio streams
-    streams = yt.streams.filter(only_audio=True)
-    # Unsorted bitrates of the audio streams
-    allAbr = {stream.abr for stream in streams}
-    # Sort based on the integer part (without the ending 'kbps')
-    return sorted(allAbr, key=lambda abr: int(abr[:-4]), reverse=True)
+    return allQualities(yt)[1]
 
 
 def getResolution(yt: YouTube, quality: str) -> str:
@@ -209,32 +323,56 @@ def getFileExt(filename: str) -> str:
     return os.path.splitext(filename)[1]
 
 
-def downloadStream(stream: Stream, title: str, dir: str) -> str:
+def downloadStream(stream: Stream, title: str, dir: str,
+                   filtered: bool = False) -> str:
     """
     Downloads a stream based on the specified configuration.
+
+    Set 'filtered' if the title has already passed through
+    filterTitle(), so it is not rewritten a second time.
     """
-    
-    title = filterTitle(title)
+
+    if not filtered:
+        title = filterTitle(title)
+
     ext = getFileExt(stream.default_filename)
-    return stream.download(dir, f"{title}{ext}")
+    # 'skip_existing=False' spares pytube a directory scan per call;
+    # retries ride out transient CDN errors mid-transfer
+    return stream.download(dir, f"{title}{ext}",
+                           skip_existing=False, max_retries=3)
 
 
-def downloadVideo(yt: YouTube, title: str, res: str, dir: str) -> str:
+def downloadVideo(yt: YouTube, title: str, res: str, dir: str,
+                  filtered: bool = False) -> str:
     """
     Downloads a video based on the specified configuration.
     """
 
-    stream = yt.streams.filter(only_video=True, res=res)[0]
-    return downloadStream(stream, title, dir)
+    stream = streamIndex(yt)[0][res]
+    return downloadStream(stream, title, dir, filtered)
 
 
-def downloadAudio(yt: YouTube, title: str, abr: str, dir: str) -> str:
+def downloadAudio(yt: YouTube, title: str, abr: str, dir: str,
+                  filtered: bool = False) -> str:
     """
     Downloads an audio based on the specified configuration.
     """
 
-    stream = yt.streams.filter(only_audio=True, abr=abr)[0]
-    return downloadStream(stream, title, dir)
+    stream = streamIndex(yt)[1][abr]
+    return downloadStream(stream, title, dir, filtered)
+
+
+# Monotonic counter for unique temporary file names;
+# next() is atomic on CPython, so it is safe across download threads
+_tempCounter = count()
+
+
+def tempSuffix() -> str:
+    """
+    Returns a unique suffix for a temporary file name.
+    """
+
+    return f".tmp{os.getpid()}_{next(_tempCounter)}"
 
 
 def downloadBoth(yt: YouTube, title: str, res: str, abr: str, dir: str) -> str:
@@ -243,19 +381,32 @@ def downloadBoth(yt: YouTube, title: str, res: str, abr: str, dir: str) -> str:
     """
 
     title = filterTitle(title)
-    # Path of the downloaded video stream
-    video = downloadVideo(yt, f"{title}{uuid.uuid4().hex}", res, dir)
-    # Path of the downloaded audio stream
-    audio = downloadAudio(yt, f"{title}{uuid.uuid4().hex}", abr, dir)
     # Path of the output file
     # 'mkv' output container can handle (almost) any codec
     output = os.path.join(dir, f"{title}.mkv")
 
-    # Merge the video and audio with ffmpeg
-    ffmpeg(video, audio, output)
-    # Remove the temporary files
-    os.remove(video)
-    os.remove(audio)
+    # Keep the intermediate streams in a temporary directory under the
+    # download location (same filesystem), so they are cleaned up even
+    # if the merge fails
+    with TemporaryDirectory(dir=dir) as tmpDir:
+        # The video and audio streams live on different hosts, so
+        # download them concurrently; the audio finishes within the
+        # video's wait
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            videoFuture = executor.submit(
+                downloadVideo, yt, f"{title}{tempSuffix()}",
+                res, tmpDir, True)
+            audioFuture = executor.submit(
+                downloadAudio, yt, f"{title}{tempSuffix()}",
+                abr, tmpDir, True)
+
+            # Path of the downloaded video stream
+            video = videoFuture.result()
+            # Path of the downloaded audio stream
+            audio = audioFuture.result()
+
+        # Merge the video and audio with ffmpeg
+        ffmpeg(video, audio, output)
 
     return output
 
@@ -266,8 +417,13 @@ def ffmpeg(video: str, audio: str, output: str):
     and outputs them as a single file.
     """
 
-    os.system(f'ffmpeg -i "{video}" -i "{audio}" -c copy "{output}"'
-              ' -y -loglevel quiet')
+    # Launch ffmpeg directly with an argument list, skipping the shell
+    # and its quote parsing (which breaks on quotes in file names)
+    subprocess.run(
+        ["ffmpeg", "-i", video, "-i", audio,
+         "-c", "copy", output, "-y", "-loglevel", "quiet"],
+        check=True,
+    )
 
 
 # Download options
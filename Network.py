@@ -0,0 +1,79 @@
+"""
+Routes pytube's HTTP calls through one shared keep-alive session.
+"""
+
+import json
+import socket
+from urllib.error import HTTPError, URLError
+
+import requests
+from requests.adapters import HTTPAdapter
+import pytube.request
+
+# Process-wide session; pooled connections let every pytube call
+# reuse an open TCP+TLS connection instead of handshaking again
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=20,
+                                       pool_maxsize=20))
+
+
+def _executeRequest(url, method=None, headers=None, data=None,
+                    timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+    """
+    Drop-in replacement for 'pytube.request._execute_request'
+    backed by the shared session.
+    """
+
+    base_headers = {"User-Agent": "Mozilla/5.0",
+                    "accept-language": "en-US,en"}
+    if headers:
+        base_headers.update(headers)
+
+    # Encode data for request
+    if data and not isinstance(data, bytes):
+        data = bytes(json.dumps(data), encoding="utf-8")
+
+    if not url.lower().startswith("http"):
+        raise ValueError("Invalid URL")
+
+    if timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+        timeout = None
+
+    # Translate transport errors into the urllib types callers expect;
+    # in particular, pytube's retry loop only recognizes URLError with
+    # a socket.timeout reason, so requests' Timeout must not leak out
+    try:
+        response = _session.request(method or "GET", url,
+                                    headers=base_headers, data=data,
+                                    timeout=timeout, stream=True)
+    except requests.exceptions.Timeout as err:
+        raise URLError(socket.timeout(str(err))) from err
+    except requests.exceptions.ConnectionError as err:
+        raise URLError(err) from err
+
+    # Keep urllib's error contract, which pytube and MyTube rely on
+    if response.status_code >= 400:
+        raise HTTPError(url, response.status_code, response.reason,
+                        response.headers, response.raw)
+
+    # Decode gzip transparently, so read() returns plain bytes
+    response.raw.decode_content = True
+    # The raw urllib3 response offers the read()/info() interface
+    # that pytube expects from urlopen
+    return response.raw
+
+
+def install():
+    """
+    Makes pytube perform all its requests through the shared session.
+    """
+
+    pytube.request._execute_request = _executeRequest
+
+
+def close():
+    """
+    Closes the shared session and its pooled connections.
+    """
+
+    _session.close()
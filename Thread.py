@@ -1,18 +1,63 @@
-"""
-Simplified implementation of threading in Qt.
-"""
-
-from typing import Callable
-
-from PySide6.QtCore import QThread
-
-
-def start(run: Callable, finished: Callable = lambda: None):
-    """
-    Sets up and starts a thread.
-    """
-
-    thread = QThread()
-    thread.run = lambda: (run(), thread.finished.emit())
-    thread.finished.connect(finished)
-    thread.start()
+"""
+Simplified implementation of threading in Qt.
+"""
+
+import traceback
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# Bound the shared pool; a few warm threads are plenty for the
+# URL checks, fetches, and downloads this program runs
+QThreadPool.globalInstance().setMaxThreadCount(4)
+
+
+class TaskSignals(QObject):
+    """
+    Signals emitted by a 'Task'.
+
+    'QRunnable' is not a 'QObject', so the signals live here.
+    """
+
+    # Carries the exception the task raised, or None on success
+    finished = Signal(object)
+
+
+class Task(QRunnable):
+    """
+    Wraps a callable for execution on the shared thread pool.
+    """
+
+    def __init__(self, run: Callable, finished: Callable):
+        super().__init__()
+
+        self._run = run
+        self.signals = TaskSignals()
+        # The signal object lives on the GUI thread, so the queued
+        # delivery runs 'finished' back on the GUI thread
+        self.signals.finished.connect(finished)
+
+    def run(self):
+        # Always emit 'finished', so a raising task cannot leave the
+        # GUI frozen with its controls disabled; the callback receives
+        # the exception, so the UI can report it instead of success
+        error = None
+
+        try:
+            self._run()
+        except Exception as err:
+            error = err
+            traceback.print_exc()
+        finally:
+            self.signals.finished.emit(error)
+
+
+def start(run: Callable, finished: Callable = lambda error=None: None):
+    """
+    Runs a task on the shared thread pool.
+
+    Reusing pooled threads avoids creating and tearing down one
+    OS thread per task.
+    """
+
+    QThreadPool.globalInstance().start(Task(run, finished))